@@ -25,6 +25,28 @@ from sktime.utils.validation import NON_FLOAT_WINDOW_LENGTH_TYPES
 from sktime.utils.validation.forecasting import check_fh
 
 
+def _coerce_iloc_ix(ix) -> np.ndarray:
+    """Coerce a single train or test index to a 1D integer array.
+
+    ``slice`` objects, yielded by ``_split`` for contiguous windows, are
+    expanded to integer arrays; integer arrays are passed through.
+    """
+    if isinstance(ix, slice):
+        return np.arange(ix.start, ix.stop)
+    return ix
+
+
+def _shift_iloc_ix(ix, anchor: int) -> np.ndarray:
+    """Shift a train or test index from _split by an integer offset.
+
+    Used to translate per-instance iloc indices to global iloc indices
+    when broadcasting a splitter over instances of a panel or hierarchy.
+    """
+    if isinstance(ix, slice):
+        return np.arange(ix.start + anchor, ix.stop + anchor)
+    return ix + anchor
+
+
 class BaseSplitter(BaseObject):
     r"""Base class for temporal cross-validation splitters.
 
@@ -129,6 +151,29 @@ class BaseSplitter(BaseObject):
         """
         y_index = self._coerce_to_index(y)
 
+        for train, test in self._split_indices(y_index):
+            yield _coerce_iloc_ix(train), _coerce_iloc_ix(test)
+
+    def _split_indices(self, y_index: pd.Index) -> SPLIT_GENERATOR_TYPE:
+        """Get raw iloc references to train/test splits of `y_index`.
+
+        Same as ``split``, except that ``y_index`` must already be a
+        ``pd.Index``, and slices yielded by ``_split`` for contiguous windows
+        are passed through instead of being expanded to integer arrays.
+        Slice references let callers use the pandas ``iloc`` view fast path.
+
+        Parameters
+        ----------
+        y_index : pd.Index
+            Index of time series to split
+
+        Yields
+        ------
+        train : 1D np.ndarray of dtype int, or slice
+            Training window indices, iloc references to training indices in y
+        test : 1D np.ndarray of dtype int, or slice
+            Test window indices, iloc references to test indices in y
+        """
         if not isinstance(y_index, pd.MultiIndex):
             split = self._split
         elif self.get_tag("split_hierarchical", False, raise_error=False):
@@ -137,13 +182,24 @@ class BaseSplitter(BaseObject):
             split = self._split_vectorized
 
         for train, test in split(y_index):
-            yield train[train >= 0], test[test >= 0]
+            # negative entries of array valued indices encode padding
+            if not isinstance(train, slice):
+                train = train[train >= 0]
+            if not isinstance(test, slice):
+                test = test[test >= 0]
+            yield train, test
 
     def _split(self, y: pd.Index) -> SPLIT_GENERATOR_TYPE:
         """Get iloc references to train/test splits of `y`.
 
         private _split containing the core logic, called from split
 
+        Contiguous windows may be yielded as ``slice`` objects instead of
+        integer arrays, ``split`` coerces these to arrays before yielding.
+        Yielded slices must be fully resolved: ``start`` and ``stop`` must
+        be concrete non-negative integers, and ``step`` must be ``None``.
+        Open-ended or negative slices are not supported.
+
         Parameters
         ----------
         y : pd.Index
@@ -151,9 +207,9 @@ class BaseSplitter(BaseObject):
 
         Yields
         ------
-        train : 1D np.ndarray of dtype int
+        train : 1D np.ndarray of dtype int, or slice
             Training window indices, iloc references to training indices in y
-        test : 1D np.ndarray of dtype int
+        test : 1D np.ndarray of dtype int, or slice
             Test window indices, iloc references to test indices in y
         """
         raise NotImplementedError("abstract method")
@@ -185,8 +241,8 @@ class BaseSplitter(BaseObject):
         test = []
         for split_inst, anchor in zip(splits, anchors):
             train_inst, test_inst = zip(*split_inst)
-            train.append(tuple(indices + anchor for indices in train_inst))
-            test.append(tuple(indices + anchor for indices in test_inst))
+            train.append(tuple(_shift_iloc_ix(ix, anchor) for ix in train_inst))
+            test.append(tuple(_shift_iloc_ix(ix, anchor) for ix in test_inst))
 
         train = map(np.concatenate, zip(*train))
         test = map(np.concatenate, zip(*test))
@@ -262,9 +318,13 @@ class BaseSplitter(BaseObject):
         use_iloc_or_loc = self.get_tag("split_series_uses", "iloc", raise_error=False)
 
         if use_iloc_or_loc == "iloc":
-            splitter_name = "split"
+            # use raw iloc references: contiguous windows arrive as slices,
+            # which pandas iloc resolves to views rather than gather copies
+            splits = self._split_indices(y_inner.index)
+            _slicer = y_inner.iloc
         elif use_iloc_or_loc == "loc":
-            splitter_name = "split_loc"
+            splits = self.split_loc(y_inner.index)
+            _slicer = y_inner.loc
         else:
             raise RuntimeError(
                 f"error in {self.__class__.__name__}.split_series: "
@@ -272,10 +332,7 @@ class BaseSplitter(BaseObject):
                 f"but found {use_iloc_or_loc}"
             )
 
-        _split = getattr(self, splitter_name)
-        _slicer = getattr(y_inner, use_iloc_or_loc)
-
-        for train, test in _split(y_inner.index):
+        for train, test in splits:
             y_train = _slicer[train]
             y_test = _slicer[test]
 
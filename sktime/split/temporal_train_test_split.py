@@ -7,10 +7,8 @@ __all__ = [
     "TemporalTrainTestSplitter",
 ]
 
-import math
 from typing import Optional
 
-import numpy as np
 import pandas as pd
 
 from sktime.split.base import BaseSplitter
@@ -20,6 +18,8 @@ from sktime.split.base._common import (
     SPLIT_TYPE,
     _split_by_fh,
 )
+from sktime.split.sameloc import SameLocSplitter
+from sktime.utils.validation.series import is_in_valid_index_types
 
 
 def temporal_train_test_split(
@@ -130,7 +130,16 @@ def temporal_train_test_split(
         test_size=test_size, train_size=train_size, anchor=anchor
     )
 
-    y_train, y_test = list(temporal_splitter.split_series(y))[0]
+    # fast path: y is a single series in pandas format with a sorted index.
+    # The split indices can be applied directly via iloc, skipping the
+    # datatype dispatch and conversion round-trip in split_series.
+    # the monotonicity requirement mirrors the index validation in
+    # split_series, which rejects unsorted single series indices
+    if _is_single_series(y) and y.index.is_monotonic_increasing:
+        train_ix, test_ix = temporal_splitter.split_indices(y)
+        y_train, y_test = y.iloc[train_ix], y.iloc[test_ix]
+    else:
+        y_train, y_test = next(iter(temporal_splitter.split_series(y)))
 
     # if X is None, return y_train, y_test
     if X is None:
@@ -138,14 +147,55 @@ def temporal_train_test_split(
 
     # if X is not None, split X as well
     # the split of X uses the same indices as the split of y
-    from sktime.split import SameLocSplitter
+    #
+    # fast path: X shares the time index of a single series y.
+    # The splitter always cuts adjacent, contiguous train and test windows,
+    # so the iloc slices of the y split apply to X unchanged,
+    # sparing the label-based index lookup that SameLocSplitter carries out.
+    if (
+        _is_single_series(y)
+        and y.index.is_monotonic_increasing
+        and _is_single_series(X)
+        and X.index.equals(y.index)
+    ):
+        return y_train, y_test, X.iloc[train_ix], X.iloc[test_ix]
+
+    # fallback for non-aligned indices: replicate the loc indices of the
+    # y split in X. For a unique X index, one get_indexer call plus take
+    # gathers all rows at once, instead of the label-based lookup through
+    # the full splitter machinery of SameLocSplitter.
+    # the monotonicity requirement mirrors the index validation that
+    # SameLocSplitter.split_series carries out, which rejects unsorted X
+    if (
+        isinstance(X, (pd.Series, pd.DataFrame))
+        and isinstance(y_train, (pd.Series, pd.DataFrame))
+        and X.index.is_unique
+        and X.index.is_monotonic_increasing
+    ):
+        train_pos = X.index.get_indexer(y_train.index)
+        test_pos = X.index.get_indexer(y_test.index)
+        # -1 marks labels of y missing in X, delegate those to
+        # SameLocSplitter, which raises KeyError on them as loc does
+        if (train_pos >= 0).all() and (test_pos >= 0).all():
+            return y_train, y_test, X.take(train_pos), X.take(test_pos)
 
     X_splitter = SameLocSplitter(temporal_splitter, y)
-    X_train, X_test = list(X_splitter.split_series(X))[0]
+    X_train, X_test = next(iter(X_splitter.split_series(X)))
 
     return y_train, y_test, X_train, X_test
 
 
+def _is_single_series(obj) -> bool:
+    """Check whether obj is a pandas container of a single time series.
+
+    Requires an sktime compatible index type, mirroring the index
+    validation of the Series mtypes, so fast paths gated on this check
+    do not accept input that split_series would reject.
+    """
+    is_pandas = isinstance(obj, (pd.Series, pd.DataFrame))
+    return is_pandas and is_in_valid_index_types(obj.index)
+
+
 class TemporalTrainTestSplitter(BaseSplitter):
     r"""Temporal train-test splitter, based on sample sizes of train or test set.
 
@@ -194,49 +244,133 @@ class TemporalTrainTestSplitter(BaseSplitter):
         self.anchor = anchor
         super().__init__()
 
-    def _split(self, y: pd.Index):
-        test_size = self.test_size
-        train_size = self.train_size
-        anchor = self.anchor
-
-        len_y = len(y)
-
+        # resolve defaults and the effective anchor once at construction,
+        # so repeated _split calls do not redo identical work
         if test_size is None and train_size is None:
             test_size = 0.25
-
         if train_size is None:
             anchor = "end"
         if test_size is None:
             anchor = "start"
 
+        # fractional sizes are stored as the exact integer ratio of the
+        # float passed, absolute sizes (int or None) are kept as passed
         if isinstance(test_size, float):
-            test_size = math.ceil(test_size * len(y))
+            self._test_frac = test_size.as_integer_ratio()
+            self._test_n = None
+        else:
+            self._test_frac = None
+            self._test_n = test_size
         if isinstance(train_size, float):
-            train_size = math.floor(train_size * len(y))
+            self._train_frac = train_size.as_integer_ratio()
+            self._train_n = None
+        else:
+            self._train_frac = None
+            self._train_n = train_size
+        self._anchor = anchor
+
+        # specialize the cut computation once at construction,
+        # the common all-integer case skips the per-call branching
+        # on size type and presence in the general _compute_cuts
+        if self._test_n is not None and self._train_n is not None:
+            if anchor == "end":
+                self._cuts_impl = self._compute_cuts_int_end
+            else:
+                self._cuts_impl = self._compute_cuts_int_start
+        else:
+            self._cuts_impl = self._compute_cuts
+
+        # memo of len(y) -> (train_slice, test_slice), since repeated
+        # splits of same-length series are common in tuning loops
+        self._cut_cache = {}
+
+    def split_indices(self, y: ACCEPTED_Y_TYPES):
+        """Get iloc references to the single train/test split of ``y``.
+
+        Lightweight alternative to ``split`` for this splitter: since the
+        splitter produces exactly one split, the pair is returned directly
+        rather than through a generator, and contiguous windows are returned
+        as ``slice`` objects, which pandas ``iloc`` resolves to views.
+        Only the index of ``y`` is inspected, no datatype checks or
+        conversions are carried out.
+
+        Parameters
+        ----------
+        y : pd.Index or time series in pandas based sktime compatible format
+            Index of time series to split, or time series to split
+
+        Returns
+        -------
+        train : slice or 1D np.ndarray of dtype int
+            Training window indices, iloc references to training indices in y
+        test : slice or 1D np.ndarray of dtype int
+            Test window indices, iloc references to test indices in y
+        """
+        if not isinstance(y, pd.Index):
+            y = y.index
+        return next(self._split_indices(y))
+
+    def _split(self, y: pd.Index):
+        yield self._cuts_for_len(len(y))
+
+    def _cuts_for_len(self, len_y: int):
+        """Return memoized (train_slice, test_slice) for a series of length len_y."""
+        cuts = self._cut_cache.get(len_y)
+        if cuts is None:
+            cuts = self._cuts_impl(len_y)
+            if len(self._cut_cache) >= 4:
+                self._cut_cache.clear()
+            self._cut_cache[len_y] = cuts
+        return cuts
+
+    def _compute_cuts_int_start(self, len_y: int):
+        """Compute cuts for integer sizes anchored at the start, see _compute_cuts."""
+        train_size = min(len_y, self._train_n)
+        test_size = min(len_y - train_size, self._test_n)
+        return slice(0, train_size), slice(train_size, train_size + test_size)
+
+    def _compute_cuts_int_end(self, len_y: int):
+        """Compute cuts for integer sizes anchored at the end, see _compute_cuts."""
+        test_size = min(len_y, self._test_n)
+        train_stop = len_y - test_size
+        train_start = max(0, train_stop - self._train_n)
+        return slice(train_start, train_stop), slice(train_stop, len_y)
+
+    def _compute_cuts(self, len_y: int):
+        """Compute (train_slice, test_slice) for a series of length len_y."""
+        anchor = self._anchor
+
+        # fractional sizes are resolved by exact integer ceil/floor division
+        # on the integer ratio of the float passed, so per-length counts
+        # involve no float rounding
+        if self._test_frac is not None:
+            num, den = self._test_frac
+            test_size = -(-num * len_y // den)
+        else:
+            test_size = self._test_n
+        if self._train_frac is not None:
+            num, den = self._train_frac
+            train_size = num * len_y // den
+        else:
+            train_size = self._train_n
         if test_size is None:
             test_size = len_y - train_size
         if train_size is None:
             train_size = len_y - test_size
 
         if anchor == "end":
-            test_size = min(len_y, test_size)
-            train_size = min(len_y - test_size, train_size)
-        else:
-            train_size = min(len_y, train_size)
-            test_size = min(len_y - train_size, test_size)
-
-        all_ix = np.arange(len_y)
-
-        if anchor == "end":
-            y_train_ix = all_ix[:-test_size]
-            y_test_ix = all_ix[-test_size:]
-            y_train_ix = y_train_ix[-train_size:]
+            train_stop = max(0, len_y - test_size)
+            train_start = max(0, train_stop - train_size)
+            test_stop = len_y
         else:  # if anchor == "start"
-            y_train_ix = all_ix[:train_size]
-            y_test_ix = all_ix[train_size:]
-            y_test_ix = y_test_ix[:test_size]
-
-        yield y_train_ix, y_test_ix
+            train_start = 0
+            train_stop = min(len_y, train_size)
+            test_stop = min(len_y, train_stop + test_size)
+
+        # train and test windows are contiguous and adjacent,
+        # so they are returned as slices - these are fast-pathed by
+        # pandas iloc to views, unlike materialized index arrays
+        return slice(train_start, train_stop), slice(train_stop, test_stop)
 
     def get_n_splits(self, y: Optional[ACCEPTED_Y_TYPES] = None) -> int:
         """Return the number of splits.
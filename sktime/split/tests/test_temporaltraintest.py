@@ -8,7 +8,7 @@ import pytest
 from sktime.datasets import load_airline
 from sktime.datatypes._utilities import get_cutoff
 from sktime.forecasting.tests._config import TEST_OOS_FHS, VALID_INDEX_FH_COMBINATIONS
-from sktime.split import temporal_train_test_split
+from sktime.split import TemporalTrainTestSplitter, temporal_train_test_split
 from sktime.utils._testing.forecasting import _make_fh
 from sktime.utils._testing.series import _make_series
 
@@ -113,6 +113,149 @@ def test_temporal_train_test_split_int_only_y():
     assert (y[43 : (43 + 29)] == y_test).all()
 
 
+@pytest.mark.parametrize(
+    "n, test_size, train_size, expected_test, expected_train",
+    [
+        (300, 2 / 3, None, 200, 100),
+        (3, 2 / 3, None, 2, 1),
+        (3, 1 / 3, None, 1, 2),
+        (6, None, 1 / 3, 5, 1),
+        (10, 0.3, None, 3, 7),
+        (10, None, 0.3, 8, 2),
+    ],
+)
+def test_temporal_train_test_split_fraction_rounding(
+    n, test_size, train_size, expected_test, expected_train
+):
+    """Test exact ceil/floor resolution of fractional sizes.
+
+    Fractional sizes are resolved by exact integer arithmetic on the
+    integer ratio of the float passed: test counts are rounded up (ceil)
+    and train counts rounded down (floor), with no float rounding in
+    between.
+    """
+    y = pd.Series(np.arange(n))
+
+    y_train, y_test = temporal_train_test_split(
+        y, test_size=test_size, train_size=train_size
+    )
+    assert len(y_test) == expected_test
+    assert len(y_train) == expected_train
+
+
+def test_temporal_train_test_split_zero_size_end_anchor():
+    """Test that zero-valued sizes with anchor="end" yield empty cuts.
+
+    Before the split computation was changed to direct bound arithmetic,
+    test_size=0 with anchor="end" returned the entire series as test set,
+    and train_size=0 returned the full prefix as train set, due to
+    negative-zero slicing of the index array. Zero now means zero samples,
+    as documented.
+    """
+    y = load_airline()
+
+    y_train, y_test = temporal_train_test_split(
+        y, train_size=100, test_size=0, anchor="end"
+    )
+    assert len(y_train) == 100
+    assert len(y_test) == 0
+    assert (y[-100:] == y_train).all()
+
+    y_train, y_test = temporal_train_test_split(
+        y, train_size=0, test_size=29, anchor="end"
+    )
+    assert len(y_train) == 0
+    assert len(y_test) == 29
+    assert (y[-29:] == y_test).all()
+
+
+def test_split_indices_equivalence():
+    """Test that split_indices slices match the arrays yielded by split."""
+    y = load_airline()
+
+    for params in TemporalTrainTestSplitter.get_test_params():
+        splitter = TemporalTrainTestSplitter(**params)
+
+        train_ix, test_ix = splitter.split_indices(y)
+        assert isinstance(train_ix, slice)
+        assert isinstance(test_ix, slice)
+
+        train_arr, test_arr = next(iter(splitter.split(y)))
+        np.testing.assert_array_equal(
+            np.arange(train_ix.start, train_ix.stop), train_arr
+        )
+        np.testing.assert_array_equal(np.arange(test_ix.start, test_ix.stop), test_arr)
+
+
+def test_temporal_train_test_split_X_paths_agree():
+    """Test that the X split agrees across X index configurations.
+
+    The split of X takes one of three paths: shared-index iloc slicing,
+    a get_indexer/take gather for non-aligned unique sorted indices, and
+    the SameLocSplitter fallback. All must return the X rows at the loc
+    indices of the y split, or raise if labels of y are missing from X.
+    """
+    y = load_airline()
+    X = pd.DataFrame({"a": range(len(y))}, index=y.index)
+
+    # aligned X: shared-index iloc fast path
+    y_train, y_test, X_train, X_test = temporal_train_test_split(y, X=X, test_size=29)
+    assert X_train.index.equals(y_train.index)
+    assert X_test.index.equals(y_test.index)
+
+    # X with additional rows not in y: get_indexer/take path, same result
+    idx_sup = pd.period_range(y.index[0], periods=len(y) + 12, freq=y.index.freq)
+    X_sup = pd.DataFrame({"a": range(len(idx_sup))}, index=idx_sup)
+    _, _, X_train_sup, X_test_sup = temporal_train_test_split(y, X=X_sup, test_size=29)
+    assert X_train_sup.equals(X_train)
+    assert X_test_sup.equals(X_test)
+
+    # X missing labels of y: KeyError from the SameLocSplitter fallback
+    X_missing = X.iloc[:-12]
+    with pytest.raises(KeyError):
+        temporal_train_test_split(y, X=X_missing, test_size=29)
+
+
+def test_temporal_train_test_split_rejects_unsorted_y():
+    """Test that single series y with unsorted index is still rejected.
+
+    The single-series fast path skips datatype dispatch, so it must not
+    accept input that split_series would reject as invalid.
+    """
+    y = load_airline().sample(frac=1, random_state=42)
+
+    with pytest.raises(TypeError):
+        temporal_train_test_split(y, test_size=3)
+
+
+def test_temporal_train_test_split_rejects_invalid_index_y():
+    """Test that single series y with invalid index type is still rejected.
+
+    A string index is monotonic but not an sktime compatible time index,
+    so the single-series fast path must fall back to split_series, which
+    rejects it.
+    """
+    y = load_airline()
+    y_str = pd.Series(y.values, index=[f"t{i:03d}" for i in range(len(y))])
+
+    with pytest.raises(TypeError):
+        temporal_train_test_split(y_str, test_size=3)
+
+
+def test_temporal_train_test_split_rejects_unsorted_X():
+    """Test that X with unsorted index is still rejected.
+
+    The get_indexer based X split must not accept input that the
+    SameLocSplitter path would reject as invalid.
+    """
+    y = load_airline()
+    X = pd.DataFrame({"a": range(len(y))}, index=y.index)
+    X_shuffled = X.sample(frac=1, random_state=42)
+
+    with pytest.raises(TypeError):
+        temporal_train_test_split(y, X=X_shuffled, test_size=3)
+
+
 def test_temporal_train_test_split_hierarchical():
     """Test correctness of temporal_train_test_split for hierarchical data.
 